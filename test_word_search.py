@@ -0,0 +1,71 @@
+"""
+Checks for the word search solver.
+
+Run with: python -m unittest
+"""
+
+import os
+import tempfile
+import unittest
+
+from word_search import load_grid, load_words, search_for_words
+
+
+class LoadGridTest(unittest.TestCase):
+
+    def load(self, text):
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as f:
+            f.write(text.encode())
+        self.addCleanup(os.remove, f.name)
+        return load_grid(f.name)
+
+    def test_separators(self):
+        # Any whitespace separates cells, as with str.split()
+        self.assertEqual(self.load("A  B\tC\n\nD\x0bE\x0cF\r\nG\xa0H I\n"),
+                         [['A', 'B', 'C'], ['D', 'E', 'F'], ['G', 'H', 'I']])
+
+    def test_ragged_rows(self):
+        with self.assertRaisesRegex(ValueError, "Grid row 2 has 2 letters, expected 3"):
+            self.load("A B C\nD E\nF G H\n")
+
+    def test_multi_letter_cell(self):
+        with self.assertRaisesRegex(ValueError, "Grid row 2 has a cell with more than one letter"):
+            self.load("A B C\nQU E F\n")
+        with self.assertRaisesRegex(ValueError, "Grid row 1 has a cell with more than one letter"):
+            self.load("\u00c9U B\n")
+
+
+class SearchForWordsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = load_grid('letter_grid.txt')
+        self.words = load_words('words_to_search.txt')
+
+    def test_finds_first_occurrence(self):
+        grid = [['C', 'A', 'T'],
+                ['A', 'X', 'A'],
+                ['T', 'A', 'C']]
+        # CAT appears several times; the earliest start cell wins
+        self.assertEqual(search_for_words(grid, ['CAT', 'TAC', 'DOG']),
+                         [('CAT', 1, 1, 'horizontal_right'),
+                          ('TAC', 1, 3, 'horizontal_left')])
+
+    def test_empty_grid(self):
+        self.assertEqual(search_for_words([], ['A']), [])
+
+    def test_dollar_sign_is_an_ordinary_letter(self):
+        self.assertEqual(search_for_words([['U', 'S', '$']], ['US$']),
+                         [('US$', 1, 1, 'horizontal_right')])
+        self.assertEqual(search_for_words([['A', '$', 'B']], ['A$', 'A']),
+                         [('A$', 1, 1, 'horizontal_right'),
+                          ('A', 1, 1, 'horizontal_right')])
+
+    def test_workers_match_single_process(self):
+        # Repeat the word list so every worker gets some words to search
+        words = self.words * 3 + ['ZZZZ', 'A']
+        self.assertEqual(search_for_words(self.grid, words, workers=3),
+                         search_for_words(self.grid, words, workers=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
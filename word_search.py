@@ -10,14 +10,37 @@ Date: 2025
 """
 
 import sys
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, List, Tuple
+
+# ASCII characters that separate grid cells (the ones str.split() treats as
+# whitespace)
+SEPARATORS = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+def read_file(filename: str) -> bytes:
+    """
+    Read a whole input file in one go.
+
+    Reading everything at once lets the caller split it into lines in one
+    call (done in C) rather than having Python read it line by line.
+
+    Args:
+        filename (str): Path to the file
+
+    Returns:
+        bytes: The raw contents of the file
+    """
+    with open(filename, 'rb') as f:
+        return f.read()
 
 def load_grid(filename: str) -> List[List[str]]:
     """
     Load the letter grid from a text file.
 
-    The grid file should have letters separated by spaces, one row per line.
-    Empty lines are ignored.
+    The grid file should have single letters separated by spaces (any
+    whitespace works), one row per line.
+    Empty lines are ignored. Every row must have the same number of letters.
 
     Args:
         filename (str): Path to the grid file
@@ -25,19 +48,48 @@ def load_grid(filename: str) -> List[List[str]]:
     Returns:
         List[List[str]]: 2D list where each inner list is a row of letters
 
+    Raises:
+        ValueError: If a cell holds more than one letter, or a row has a
+            different number of letters than the first
+
     Example grid file:
         W I S D O M
         B C I A K D
         S H A I M E
     """
     grid = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()  # Remove whitespace from start/end
-            if line:  # Skip empty lines
-                # Split line by spaces and keep only non-empty parts
-                letters = [char for char in line.split() if char]
-                grid.append(letters)
+    for line in read_file(filename).splitlines():
+        if line.isascii():
+            # Fast path: delete the separators in one go, leaving just the
+            # row's letters, and decode the result once
+            letters = list(line.translate(None, SEPARATORS).decode())
+
+            # In the usual layout ("A B C") letters and single separators
+            # alternate, which is cheap to confirm. Anything else is split
+            # properly to count its cells.
+            row = line.strip()
+            if len(row) == 2 * len(letters) - 1 and not row[1::2].translate(None, SEPARATORS):
+                multi_letter = False
+            else:
+                multi_letter = len(line.decode().split()) != len(letters)
+        else:
+            # Non-ASCII letters take several bytes each, and Unicode has more
+            # separators (such as the no-break space), so split the text
+            letters = line.decode().split()
+            multi_letter = any(len(letter) > 1 for letter in letters)
+
+        if not letters:
+            continue  # Skip empty lines
+
+        # Each cell must be a single letter: "QU" would otherwise be split
+        # into two cells, or make the row look the wrong width
+        if multi_letter:
+            raise ValueError(f"Grid row {len(grid) + 1} has a cell with more than one letter; "
+                             f"separate every letter with a space")
+        if grid and len(letters) != len(grid[0]):
+            raise ValueError(f"Grid row {len(grid) + 1} has {len(letters)} letters, "
+                             f"expected {len(grid[0])}")
+        grid.append(letters)
     return grid
 
 def load_words(filename: str) -> List[str]:
@@ -59,11 +111,10 @@ def load_words(filename: str) -> List[str]:
         EXODUS
     """
     words = []
-    with open(filename, 'r') as f:
-        for line in f:
-            word = line.strip().upper()  # Remove whitespace and make uppercase
-            if word:  # Skip empty lines
-                words.append(word)
+    for line in read_file(filename).splitlines():
+        word = line.strip().decode().upper()  # Remove whitespace and make uppercase
+        if word:  # Skip empty lines
+            words.append(word)
     return words
 
 def get_directions() -> List[Tuple[int, int, str]]:
@@ -128,6 +179,9 @@ def find_word_in_direction(grid: List[List[str]], word: str, start_row: int, sta
     This function "walks" through the grid in the specified direction, checking
     if each letter of the word matches the corresponding grid position.
 
+    This is a standalone helper for checking a single placement. The trie
+    search in search_for_words does not call it.
+
     Args:
         grid (List[List[str]]): The 2D letter grid
         word (str): The word to search for (already uppercase)
@@ -143,39 +197,203 @@ def find_word_in_direction(grid: List[List[str]], word: str, start_row: int, sta
         If word="CAT", start_row=0, start_col=0, delta_row=0, delta_col=1:
         Checks grid[0][0]=='C', grid[0][1]=='A', grid[0][2]=='T'
     """
+    # The word runs in a straight line, so if its first and last letters are
+    # inside the grid then every letter in between is too. Check the bounds
+    # once for the whole word instead of once per letter.
+    height, width = len(grid), len(grid[0])
+    end_row = start_row + (len(word) - 1) * delta_row
+    end_col = start_col + (len(word) - 1) * delta_col
+    if not (0 <= start_row < height and 0 <= start_col < width
+            and 0 <= end_row < height and 0 <= end_col < width):
+        return False
+
     # Loop through each character in the word
     for i, char in enumerate(word):
-        # Calculate the position for this character
-        row = start_row + i * delta_row
-        col = start_col + i * delta_col
-
-        # If position is out of bounds OR letter doesn't match, word not found
-        if not is_valid_position(grid, row, col) or grid[row][col] != char:
+        # If the letter at this position doesn't match, word not found
+        if grid[start_row + i * delta_row][start_col + i * delta_col] != char:
             return False
 
     # All characters matched - word found!
     return True
 
-def search_for_words(grid: List[List[str]], words: List[str]) -> List[Tuple[str, int, int, str]]:
+def get_direction_lines(grid: List[List[str]]) -> List[Tuple[str, int, int, int, int, str]]:
+    """
+    Read the grid as straight lines of text, once for every direction.
+
+    A line starts at each cell whose previous cell (one step backwards in the
+    direction) is off the grid, and runs forward until it leaves the grid.
+    Together the lines cover every (cell, direction) pair exactly once.
+
+    Args:
+        grid (List[List[str]]): The 2D letter grid
+
+    Returns:
+        List[Tuple[str, int, int, int, int, str]]: List of
+            (line, start_row, start_col, delta_row, delta_col, direction) tuples.
+            Character k of a line sits at
+            (start_row + k * delta_row, start_col + k * delta_col).
+
+    Example:
+        For the row "W I S" and direction horizontal_left, the line is "SIW"
+        starting at row 0, column 2.
+    """
+    def steps_left(start: int, delta: int, size: int) -> int:
+        # Cells left along one axis, counting the start cell itself
+        if delta > 0:
+            return size - start
+        if delta < 0:
+            return start + 1
+        return sys.maxsize  # Not moving on this axis, so it never runs out
+
+    if not grid:
+        return []  # An empty grid has no lines
+
+    # Lay the whole grid out as one flat string, row after row. Cell
+    # (row, col) is then flat[row * width + col], and one step in direction
+    # (delta_row, delta_col) is a fixed stride of delta_row * width + delta_col.
+    height, width = len(grid), len(grid[0])
+    flat = "".join("".join(row) for row in grid)
+
+    lines = []
+    for delta_row, delta_col, direction in get_directions():
+        # (A one-column grid makes some diagonal strides 0; those lines are a
+        # single letter long, so any non-zero stride cuts them out correctly.)
+        stride = delta_row * width + delta_col or 1
+
+        # A line starts where stepping backwards would leave the grid: on the
+        # edge row it moves away from and/or the edge column it moves away
+        # from. Listing those edge cells directly avoids testing every cell.
+        starts = set()
+        if delta_row:
+            edge_row = 0 if delta_row > 0 else height - 1
+            starts.update((edge_row, col) for col in range(width))
+        if delta_col:
+            edge_col = 0 if delta_col > 0 else width - 1
+            starts.update((row, edge_col) for row in range(height))
+
+        for start_row, start_col in sorted(starts):
+            # Work out how many steps fit before we fall off the grid, so
+            # the walk below needs no bounds checks of its own
+            length = min(steps_left(start_row, delta_row, height),
+                         steps_left(start_col, delta_col, width))
+
+            # Cut the line out of the flat string with a stepped slice.
+            # When walking backwards to index 0, the slice must run to the
+            # start of the string (None), since an end of -1 means "last".
+            first = start_row * width + start_col
+            stop = first + length * stride
+            line = flat[first:stop if stop >= 0 else None:stride]
+
+            lines.append((line, start_row, start_col,
+                          delta_row, delta_col, direction))
+    return lines
+
+def build_trie(words: List[str]) -> Dict[Any, Any]:
+    """
+    Build a trie (prefix tree) holding all the words.
+
+    Each node is a dictionary mapping the next letter to a child node. A node
+    where a word ends also has the key None pointing to that word (None can
+    never be a letter, so it cannot clash with the grid's contents). Words that
+    share a beginning share the same path, so one walk through the trie
+    checks all of them at once.
+
+    Args:
+        words (List[str]): List of words to search for (already uppercase)
+
+    Returns:
+        Dict[Any, Any]: The root node of the trie
+
+    Example:
+        build_trie(["AMOS", "AMEN"]) gives
+        {'A': {'M': {'O': {'S': {None: 'AMOS'}}, 'E': {'N': {None: 'AMEN'}}}}}
+    """
+    root = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[None] = word  # Marks the end of a word
+    return root
+
+def find_words_in_lines(lines: List[Tuple[str, int, int, int, int, str]],
+                        trie: Dict[Any, Any],
+                        min_length: int = 1) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Walk the trie from every letter of every line and record the words found.
+
+    From each starting letter we follow the trie one letter at a time until
+    the path dies out or the line ends. Every node with a None key along the way is
+    a word that starts at that letter.
+
+    Args:
+        lines (List[Tuple[str, int, int, int, int, str]]): Direction lines from
+            get_direction_lines()
+        trie (Dict[Any, Any]): Root node from build_trie()
+        min_length (int): Length of the shortest word in the trie. Letters
+            closer than this to the end of a line cannot start any word.
+
+    Returns:
+        Dict[str, Tuple[int, int, int]]: For each word found, the smallest
+            (row, col, direction_index) where it starts (0-based)
+    """
+    direction_order = {direction: index
+                       for index, (_, _, direction) in enumerate(get_directions())}
+    first_match = {}
+
+    for line, start_row, start_col, delta_row, delta_col, direction in lines:
+        direction_index = direction_order[direction]
+
+        line_length = len(line)  # Looked up once, not on every step
+
+        # Try every letter of the line that leaves room for the shortest word
+        for start in range(line_length - min_length + 1):
+            node = trie.get(line[start])  # Only letters that begin some word
+            position = start
+            while node is not None:
+                if None in node:
+                    # A whole word ends here: note where it started
+                    word = node[None]
+                    match = (start_row + start * delta_row,
+                             start_col + start * delta_col,
+                             direction_index)
+                    if word not in first_match or match < first_match[word]:
+                        first_match[word] = match
+
+                # Step to the next letter, stopping at the end of the line
+                position += 1
+                if position == line_length:
+                    break
+                node = node.get(line[position])
+
+    return first_match
+
+def search_for_words(grid: List[List[str]], words: List[str],
+                     workers: int = 1) -> List[Tuple[str, int, int, str]]:
     """
     Search the entire grid for all words in all 8 directions.
 
-    This is the main search algorithm. It uses a brute-force approach:
-    for each word, try every possible starting position, in every direction.
+    This is the main search algorithm. All the words are put into a trie,
+    and the grid is read as lines of text (one set per direction). Walking
+    the trie along the lines finds every word in one pass, so the time taken
+    barely depends on how many words there are.
 
     Args:
         grid (List[List[str]]): The 2D letter grid
         words (List[str]): List of words to search for
+        workers (int): Number of processes to search with (default 1, meaning
+            search in this process). Worth raising only for large grids.
 
     Returns:
         List[Tuple[str, int, int, str]]: List of found words with their details.
             Each tuple contains: (word, start_row_1based, start_col_1based, direction)
 
     Algorithm explanation:
-    1. For each word in the list
-    2. Try every possible starting position (every row, every column)
-    3. For each starting position, try all 8 directions
-    4. If word is found in any direction, record it and move to next word
+    1. Build a trie from all the words
+    2. Turn the grid into lines of text, one set of lines per direction
+    3. From every letter of every line, follow the trie as far as it goes
+    4. Keep the first occurrence of each word: the smallest starting row,
+       then column, then direction in get_directions() order
     5. Return list of all found words
 
     Note: This finds the FIRST occurrence of each word. If a word appears
@@ -184,31 +402,43 @@ def search_for_words(grid: List[List[str]], words: List[str]) -> List[Tuple[str,
     found_words = []  # Will store results: (word, row, col, direction)
     directions = get_directions()  # Get the 8 possible directions
 
-    # Loop through each word we want to find
+    # A word listed more than once only needs to go into the trie once
+    # (dict.fromkeys keeps the first copy of each, in order). Every copy is
+    # still reported below, so the results match the word list line for line.
+    unique_words = list(dict.fromkeys(words))
+
+    # The trie marks every word end, including words that are prefixes of
+    # longer words, so one walk from a start letter finds all of them
+    trie = build_trie(unique_words)
+    lines = get_direction_lines(grid)
+    min_length = min((len(word) for word in unique_words if word), default=1)
+
+    # Each line is searched independently, so with several workers the lines
+    # are shared out between processes and their results merged afterwards.
+    # (Threads would not help here: the trie walk holds the GIL.)
+    if workers > 1 and len(lines) > 1:
+        chunk_size = -(-len(lines) // workers)  # Round up so no line is left out
+        chunks = [lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(find_words_in_lines, chunks, repeat(trie),
+                                        repeat(min_length)))
+    else:
+        results = [find_words_in_lines(lines, trie, min_length)]
+
+    # Merge the results, keeping the earliest occurrence of each word
+    first_match = {}
+    for result in results:
+        for word, match in result.items():
+            if word not in first_match or match < first_match[word]:
+                first_match[word] = match
+
+    # Collect the results, keeping the same order as the word list
     for word in words:
-        word_found = False  # Track if we found this word yet
-
-        # Try every possible starting position in the grid
-        for start_row in range(len(grid)):  # For each row
-            for start_col in range(len(grid[0])):  # For each column
-
-                # Try every possible direction from this starting position
-                for delta_row, delta_col, direction in directions:
-
-                    # Check if the word exists in this direction
-                    if find_word_in_direction(grid, word, start_row, start_col, delta_row, delta_col):
-
-                        # Found it! Convert to 1-based indexing for user-friendly output
-                        # (computers use 0-based, but humans prefer 1-based counting)
-                        found_words.append((word, start_row + 1, start_col + 1, direction))
-                        word_found = True
-                        break  # No need to check other directions for this word
-
-                if word_found:
-                    break  # No need to try other starting positions for this word
-
-            if word_found:
-                break  # Move to next word in the list
+        if word in first_match:
+            # Found it! Convert to 1-based indexing for user-friendly output
+            # (computers use 0-based, but humans prefer 1-based counting)
+            row, col, direction_index = first_match[word]
+            found_words.append((word, row + 1, col + 1, directions[direction_index][2]))
 
     return found_words
 
@@ -220,21 +450,24 @@ def main():
     1. Checks command line arguments
     2. Loads the grid and word files
     3. Runs the word search
-    4. Displays results on screen
-    5. Saves results to a file
+    4. Formats the results table
+    5. Displays results on screen
+    6. Saves results to a file
 
-    Command line usage: python word_search.py <grid_file> <words_file>
+    Command line usage: python word_search.py <grid_file> <words_file> [workers]
     """
 
-    # Check if user provided exactly 2 arguments (grid file and words file)
-    if len(sys.argv) != 3:
-        print("Usage: python word_search.py <grid_file> <words_file>")
+    # Check if user provided 2 arguments (grid file and words file), plus
+    # optionally the number of worker processes to search with
+    if len(sys.argv) not in (3, 4) or (len(sys.argv) == 4 and not sys.argv[3].isdigit()):
+        print("Usage: python word_search.py <grid_file> <words_file> [workers]")
         print("Example: python word_search.py letter_grid.txt words_to_search.txt")
         sys.exit(1)
 
     # Get filenames from command line arguments
     grid_file = sys.argv[1]   # First argument: grid file
     words_file = sys.argv[2]  # Second argument: words file
+    workers = int(sys.argv[3]) if len(sys.argv) == 4 else 1  # Optional third argument
 
     try:
         # Step 1: Load the letter grid from file
@@ -249,28 +482,28 @@ def main():
         print()  # Empty line for readability
 
         # Step 3: Search for all words in the grid
-        found_words = search_for_words(grid, words)
+        found_words = search_for_words(grid, words, workers)
+
+        # Step 4: Format the results table once, as a single string, so the
+        # screen and the file share the same text
+        table_lines = [f"{'Word':<15} {'Start Row':>9} {'Start Col':>9} {'Direction':<20}",
+                       "-" * 55]  # Table header and separator line
+        table_lines += [f"{word:<15} {row:>9} {col:>9} {direction:<20}"
+                        for word, row, col, direction in found_words]
+        table = "\n".join(table_lines) + "\n"
 
-        # Step 4: Display results on screen
+        # Step 5: Display results on screen
         if found_words:
             print(f"Found {len(found_words)} words:")
-            # Print table header with fixed-width columns
-            print(f"{'Word':<15} {'Start Row':>9} {'Start Col':>9} {'Direction':<20}")
-            print("-" * 55)  # Separator line
-
-            # Print each found word in a nicely formatted row
-            for word, row, col, direction in found_words:
-                print(f"{word:<15} {row:>9} {col:>9} {direction:<20}")
+            sys.stdout.write(table)
         else:
             print("No words found in the grid.")
 
-        # Step 5: Save results to a file for later reference
-        with open('word_search_results.txt', 'w') as f:
-            # Write the same formatted table to file
-            f.write(f"{'Word':<15} {'Start Row':>9} {'Start Col':>9} {'Direction':<20}\n")
-            f.write("-" * 55 + "\n")
-            for word, row, col, direction in found_words:
-                f.write(f"{word:<15} {row:>9} {col:>9} {direction:<20}\n")
+        # Step 6: Save results to a file for later reference
+        # The same formatted table as on screen, encoded once and written
+        # in binary mode so it skips the text layer's per-write encoding
+        with open('word_search_results.txt', 'wb') as f:
+            f.write(table.encode())
 
         print("\nResults also saved to word_search_results.txt")
 